@@ -1,6 +1,8 @@
 """Intrinio Balance Sheet Model."""
 
+import hashlib
 import warnings
+from datetime import date as dateType
 from typing import Any, Dict, List, Literal, Optional
 
 from openbb_core.provider.abstract.fetcher import Fetcher
@@ -8,12 +10,34 @@ from openbb_core.provider.standard_models.balance_sheet import (
     BalanceSheetData,
     BalanceSheetQueryParams,
 )
-from openbb_core.provider.utils.helpers import ClientResponse, amake_requests
-from openbb_intrinio.utils.helpers import get_data_one
+from openbb_core.provider.utils.helpers import (
+    ClientResponse,
+    ClientSession,
+    amake_requests,
+    get_querystring,
+)
+from openbb_intrinio.utils.helpers import (
+    get_data_one,
+    intrinio_fundamentals_cache,
+    intrinio_statements_cache,
+)
 from pydantic import Field, field_validator, model_validator
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore
+
 _warn = warnings.warn
 
+# Intrinio statement types for the query periods
+_PERIOD_MAP = {"annual": "FY", "quarter": "QTR"}
+
+# Cache lifetimes in seconds for the Intrinio response caches
+_FUNDAMENTALS_CACHE_TTL = 15 * 60
+# Statements older than the previous fiscal year are final and never expire
+_RECENT_STATEMENTS_CACHE_TTL = 60 * 60
+
 
 class IntrinioBalanceSheetQueryParams(BalanceSheetQueryParams):
     """Intrinio Balance Sheet Query.
@@ -32,14 +56,13 @@ class IntrinioBalanceSheetQueryParams(BalanceSheetQueryParams):
     @classmethod
     def validate_period(cls, v):
         """Validate period."""
-        v = "FY" if v == "annual" else "QTR"
-        return v
+        return _PERIOD_MAP[v]
 
     @field_validator("symbol", mode="after", check_fields=False)
     @classmethod
     def handle_symbol(cls, v) -> str:
         """Handle symbols with a dash and replace it with a dot for Intrinio."""
-        return v.replace("-", ".")
+        return v.replace("-", ".") if "-" in v else v
 
 
 class IntrinioBalanceSheetData(BalanceSheetData):
@@ -90,7 +113,7 @@ class IntrinioBalanceSheetData(BalanceSheetData):
         "total_non_current_assets": "totalnoncurrentassets",
         "federal_funds_purchased_and_securities_sold": "fedfundspurchased",
         "short_term_debt": "shorttermdebt",
-        "bankers_acceptance_out_standing": "bankersacceptances",
+        "bankers_acceptance_outstanding": "bankersacceptances",
         "accrued_interest_payable": "accruedinterestpayable",
         "accounts_payable": "accountspayable",
         "accrued_expenses": "accruedexpenses",
@@ -388,9 +411,56 @@ class IntrinioBalanceSheetData(BalanceSheetData):
 
     @model_validator(mode="before")
     @classmethod
-    def replace_zero(cls, values):  # pylint: disable=no-self-argument
-        """Check for zero values and replace with None."""
-        return {k: None if v == 0 else v for k, v in values.items()}
+    def _use_alias(cls, values):
+        """Map Intrinio data tags to field names with the precomputed lookup."""
+        return {_TAG_TO_FIELD.get(k, k): v for k, v in values.items()}
+
+
+# Intrinio data tag -> field name, so rows are built with canonical keys
+_TAG_TO_FIELD = {
+    alias: field for field, alias in IntrinioBalanceSheetData.__alias_dict__.items()
+}
+
+
+def _extract_financials(financials: List[Dict]) -> Dict[str, Any]:
+    """Extract the values of a standardized financials array into a row."""
+    row: Dict[str, Any] = {}
+    get_field = _TAG_TO_FIELD.get
+
+    for sub_item in financials:
+        tag = sub_item["data_tag"]["tag"]
+        field_name = get_field(tag)
+        value = sub_item["value"]
+        # Intrinio sends numbers, strings are only parsed as a fallback.
+        if isinstance(value, str):
+            value = float(value) if value else None
+        # Zero and empty values are reported as None.
+        if not value:
+            value = None
+        # The rows are not validated, so whole values of declared fields are
+        # cast to int here. Fractional values are kept as float rather than
+        # truncated, and unknown tags are kept as extras.
+        if field_name:
+            row[field_name] = (
+                int(value) if value is not None and value % 1 == 0 else value
+            )
+        else:
+            row[tag] = value
+
+    return row
+
+
+def _build_row(item: Dict, qtr_mode: bool) -> IntrinioBalanceSheetData:
+    """Build the balance sheet data for one fiscal period."""
+    row = _extract_financials(item["financials"])
+    row["period_ending"] = dateType.fromisoformat(item["period_ending"])
+    row["fiscal_year"] = item["fiscal_year"]
+    fiscal_period = item["fiscal_period"]
+    # Intrinio does not return Q4 data but FY data instead
+    row["fiscal_period"] = "Q4" if qtr_mode and fiscal_period == "FY" else fiscal_period
+
+    # Intrinio payloads are trusted, skip the validation pipeline
+    return IntrinioBalanceSheetData.model_construct(**row)
 
 
 class IntrinioBalanceSheetFetcher(
@@ -416,71 +486,106 @@ class IntrinioBalanceSheetFetcher(
         api_key = credentials.get("intrinio_api_key") if credentials else ""
         statement_code = "balance_sheet_statement"
 
-        fundamentals_data: Dict = {}
         base_url = "https://api-v2.intrinio.com"
-        fundamentals_url = (
-            f"{base_url}/companies/{query.symbol}/fundamentals?"
-            f"statement_code={statement_code}&type={query.period}"
+        if query.fiscal_year is not None and query.fiscal_year < 2008:
+            _warn("Financials data is only available from 2008 and later.")
+            query.fiscal_year = 2008
+        query_str = get_querystring(
+            {
+                "statement_code": statement_code,
+                "type": query.period,
+                "fiscal_year": query.fiscal_year,
+                "api_key": api_key,
+            },
+            [],
         )
-        if query.fiscal_year is not None:
-            if query.fiscal_year < 2008:
-                _warn("Financials data is only available from 2008 and later.")
-                query.fiscal_year = 2008
-            fundamentals_url = fundamentals_url + f"&fiscal_year={query.fiscal_year}"
-        fundamentals_url = fundamentals_url + f"&api_key={api_key}"
-        fundamentals_data = (await get_data_one(fundamentals_url, **kwargs)).get(
-            "fundamentals", []
+        fundamentals_url = (
+            f"{base_url}/companies/{query.symbol}/fundamentals?{query_str}"
         )
 
+        # One pooled session serves the metadata lookup and all periods, which
+        # are fetched concurrently.
+        session = ClientSession()
+
+        # Cache entries are keyed on a digest so the API key is never stored
+        key_hash = hashlib.sha256((api_key or "").encode()).hexdigest()
+
+        # The list of available periods rarely changes, reuse it for a while
+        cache_key = (query.symbol, query.period, query.fiscal_year, key_hash)
+        fundamentals_data = intrinio_fundamentals_cache.get(cache_key)
+        if fundamentals_data is None:
+            try:
+                fundamentals_data = (
+                    await get_data_one(fundamentals_url, session=session, **kwargs)
+                ).get("fundamentals", [])
+            except Exception:
+                await session.close()
+                raise
+            # An empty listing may be transient, so it is not cached
+            if fundamentals_data:
+                intrinio_fundamentals_cache.set(
+                    cache_key, fundamentals_data, _FUNDAMENTALS_CACHE_TTL
+                )
+
         fiscal_periods = [
             f"{item['fiscal_year']}-{item['fiscal_period']}"
             for item in fundamentals_data
         ]
         fiscal_periods = fiscal_periods[: query.limit]
 
+        current_year = dateType.today().year
+
         async def callback(response: ClientResponse, _: Any) -> Dict:
             """Return the response."""
-            statement_data = await response.json()
-            return {
-                "period_ending": statement_data["fundamental"]["end_date"],
-                "fiscal_year": statement_data["fundamental"]["fiscal_year"],
-                "fiscal_period": statement_data["fundamental"]["fiscal_period"],
+            statement_data = json_loads(await response.read())
+            fundamental = statement_data["fundamental"]
+            result = {
+                "period_ending": fundamental["end_date"],
+                "fiscal_year": fundamental["fiscal_year"],
+                "fiscal_period": fundamental["fiscal_period"],
                 "financials": statement_data["standardized_financials"],
             }
+            period = f"{result['fiscal_year']}-{result['fiscal_period']}"
+            ttl = (
+                float("inf")
+                if result["fiscal_year"] < current_year - 1
+                else _RECENT_STATEMENTS_CACHE_TTL
+            )
+            intrinio_statements_cache.set(
+                (query.symbol, statement_code, period, key_hash), result, ttl
+            )
+            return result
+
+        # Reported statements do not change, only request the missing periods
+        statements: Dict[str, Dict] = {}
+        for period in fiscal_periods:
+            cached = intrinio_statements_cache.get(
+                (query.symbol, statement_code, period, key_hash)
+            )
+            if cached is not None:
+                statements[period] = cached
 
+        url_prefix = f"{base_url}/fundamentals/{query.symbol}-{statement_code}-"
+        url_suffix = f"/standardized_financials?api_key={api_key}"
         urls = [
-            f"{base_url}/fundamentals/{query.symbol}-{statement_code}-{period}/standardized_financials?api_key={api_key}"
+            url_prefix + period + url_suffix
             for period in fiscal_periods
+            if period not in statements
         ]
 
-        return await amake_requests(urls, callback, **kwargs)
+        results = await amake_requests(urls, callback, session=session, **kwargs)
+        if not statements:
+            return results
+
+        for result in results:
+            statements[f"{result['fiscal_year']}-{result['fiscal_period']}"] = result
+
+        return [statements[period] for period in fiscal_periods if period in statements]
 
     @staticmethod
     def transform_data(
         query: IntrinioBalanceSheetQueryParams, data: List[Dict], **kwargs: Any
     ) -> List[IntrinioBalanceSheetData]:
         """Return the transformed data."""
-        transformed_data: List[IntrinioBalanceSheetData] = []
-
-        for item in data:
-            sub_dict: Dict[str, Any] = {}
-
-            for sub_item in item["financials"]:
-                field_name = sub_item["data_tag"]["tag"]
-                sub_dict[field_name] = (
-                    float(sub_item["value"])
-                    if sub_item["value"] and sub_item["value"] != 0
-                    else None
-                )
-
-            sub_dict["period_ending"] = item["period_ending"]
-            sub_dict["fiscal_year"] = item["fiscal_year"]
-            sub_dict["fiscal_period"] = item["fiscal_period"]
-
-            # Intrinio does not return Q4 data but FY data instead
-            if query.period == "QTR" and item["fiscal_period"] == "FY":
-                sub_dict["fiscal_period"] = "Q4"
-
-            transformed_data.append(IntrinioBalanceSheetData(**sub_dict))
-
-        return transformed_data
+        qtr_mode = query.period == "QTR"
+        return [_build_row(item, qtr_mode) for item in data]
@@ -2,12 +2,13 @@
 
 import asyncio
 import json
+import time
 from datetime import (
     date as dateType,
     timedelta,
 )
 from io import StringIO
-from typing import Any, Dict, List, Optional, TypeVar, Union
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar, Union
 
 from openbb_core.provider.utils.errors import EmptyDataError
 from openbb_core.provider.utils.helpers import (
@@ -20,6 +21,45 @@ from pydantic import BaseModel
 T = TypeVar("T", bound=BaseModel)
 
 
+class TTLCache:
+    """In-process cache where every entry expires after its own time to live.
+
+    The oldest entry is evicted once the cache holds `maxsize` entries.
+    """
+
+    def __init__(self, maxsize: int = 256, timer: Callable[[], float] = time.monotonic):
+        """Initialize the TTLCache class."""
+        self.maxsize = maxsize
+        self.timer = timer
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value, or None if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= self.timer():
+            del self._entries[key]
+            return None
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Store the value for `ttl` seconds."""
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (self.timer() + ttl, value)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+
+# Company fundamentals listings and standardized financials statements
+intrinio_fundamentals_cache = TTLCache()
+intrinio_statements_cache = TTLCache()
+
+
 class BasicResponse:
     """Basic Response class."""
 
@@ -0,0 +1,221 @@
+import asyncio
+import json
+from datetime import date
+
+import pytest
+from openbb_intrinio.models import balance_sheet
+from openbb_intrinio.models.balance_sheet import (
+    IntrinioBalanceSheetFetcher,
+    IntrinioBalanceSheetQueryParams,
+)
+from openbb_intrinio.utils.helpers import (
+    intrinio_fundamentals_cache,
+    intrinio_statements_cache,
+)
+
+CURRENT_YEAR = date.today().year
+FISCAL_YEARS = [CURRENT_YEAR, CURRENT_YEAR - 1, CURRENT_YEAR - 2, CURRENT_YEAR - 3]
+
+
+def make_statement(fiscal_year, fiscal_period="FY", financials=None):
+    return {
+        "period_ending": f"{fiscal_year}-12-31",
+        "fiscal_year": fiscal_year,
+        "fiscal_period": fiscal_period,
+        "financials": financials or [],
+    }
+
+
+def make_financial(tag, value):
+    return {"data_tag": {"tag": tag}, "value": value}
+
+
+@pytest.mark.parametrize("value", [0, 0.0, "0", "0.0", "", None])
+def test_intrinio_balance_sheet_zero_values(value):
+    query = IntrinioBalanceSheetQueryParams(symbol="AAPL")
+    data = [
+        make_statement(
+            2023,
+            financials=[
+                make_financial("cashandequivalents", value),
+                make_financial("someextratag", value),
+            ],
+        )
+    ]
+
+    result = IntrinioBalanceSheetFetcher.transform_data(query, data)[0]
+
+    assert result.cash_and_cash_equivalents is None
+    assert result.model_extra["someextratag"] is None
+
+
+def test_intrinio_balance_sheet_fractional_values():
+    query = IntrinioBalanceSheetQueryParams(symbol="AAPL")
+    data = [
+        make_statement(
+            2023,
+            financials=[
+                make_financial("cashandequivalents", 1000.0),
+                make_financial("restrictedcash", 2.5),
+                make_financial("goodwill", "7.25"),
+            ],
+        )
+    ]
+
+    result = IntrinioBalanceSheetFetcher.transform_data(query, data)[0]
+
+    assert result.cash_and_cash_equivalents == 1000
+    assert isinstance(result.cash_and_cash_equivalents, int)
+    assert result.restricted_cash == 2.5
+    assert result.goodwill == 7.25
+
+
+def test_intrinio_balance_sheet_only_reported_fields_are_set():
+    query = IntrinioBalanceSheetQueryParams(symbol="AAPL")
+    data = [
+        make_statement(
+            2023,
+            financials=[
+                make_financial("cashandequivalents", 1000.0),
+                make_financial("goodwill", 0),
+            ],
+        )
+    ]
+
+    result = IntrinioBalanceSheetFetcher.transform_data(query, data)[0]
+
+    assert set(result.model_dump(exclude_unset=True)) == {
+        "cash_and_cash_equivalents",
+        "goodwill",
+        "period_ending",
+        "fiscal_year",
+        "fiscal_period",
+    }
+
+
+class MockResponse:
+    def __init__(self, url):
+        self.url = url
+
+    async def read(self):
+        period = self.url.split("balance_sheet_statement-")[1].split("/")[0]
+        fiscal_year, fiscal_period = period.split("-")
+        return json.dumps(
+            {
+                "fundamental": {
+                    "end_date": f"{fiscal_year}-12-31",
+                    "fiscal_year": int(fiscal_year),
+                    "fiscal_period": fiscal_period,
+                },
+                "standardized_financials": [],
+            }
+        ).encode()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    for cache in (intrinio_fundamentals_cache, intrinio_statements_cache):
+        cache.clear()
+        monkeypatch.setattr(cache, "timer", lambda: now[0])
+    yield now
+    intrinio_fundamentals_cache.clear()
+    intrinio_statements_cache.clear()
+
+
+@pytest.fixture
+def requested_urls(monkeypatch, clock):
+    urls = []
+
+    async def mock_get_data_one(url, **kwargs):
+        urls.append(url)
+        await kwargs["session"].close()
+        return {
+            "fundamentals": [
+                {"fiscal_year": year, "fiscal_period": "FY"} for year in FISCAL_YEARS
+            ]
+        }
+
+    async def mock_amake_requests(period_urls, callback, **kwargs):
+        await kwargs["session"].close()
+        urls.extend(period_urls)
+        return [await callback(MockResponse(url), None) for url in period_urls]
+
+    monkeypatch.setattr(balance_sheet, "get_data_one", mock_get_data_one)
+    monkeypatch.setattr(balance_sheet, "amake_requests", mock_amake_requests)
+    return urls
+
+
+def extract(limit):
+    query = IntrinioBalanceSheetQueryParams(symbol="AAPL", limit=limit)
+    data = asyncio.run(
+        IntrinioBalanceSheetFetcher.aextract_data(query, {"intrinio_api_key": "KEY"})
+    )
+    return [item["fiscal_year"] for item in data]
+
+
+def count_period_requests(urls):
+    return sum("standardized_financials" in url for url in urls)
+
+
+def test_intrinio_balance_sheet_cache_full_hit(requested_urls):
+    assert extract(limit=3) == FISCAL_YEARS[:3]
+    requested_urls.clear()
+
+    assert extract(limit=3) == FISCAL_YEARS[:3]
+    assert requested_urls == []
+
+
+def test_intrinio_balance_sheet_cache_partial_hit_keeps_order(requested_urls):
+    assert extract(limit=2) == FISCAL_YEARS[:2]
+    requested_urls.clear()
+
+    assert extract(limit=4) == FISCAL_YEARS
+    assert count_period_requests(requested_urls) == 2
+    assert all(
+        f"-{year}-FY/" in url for url, year in zip(requested_urls, FISCAL_YEARS[2:])
+    )
+
+
+def test_intrinio_balance_sheet_cache_expiry(requested_urls, clock):
+    assert extract(limit=4) == FISCAL_YEARS
+    requested_urls.clear()
+
+    # Past the fundamentals TTL only the listing is requested again
+    clock[0] += balance_sheet._FUNDAMENTALS_CACHE_TTL + 1
+    assert extract(limit=4) == FISCAL_YEARS
+    assert len(requested_urls) == 1
+    assert "/companies/AAPL/fundamentals" in requested_urls[0]
+    requested_urls.clear()
+
+    # Past the recent statements TTL only the open fiscal years are refetched
+    clock[0] += balance_sheet._RECENT_STATEMENTS_CACHE_TTL
+    assert extract(limit=4) == FISCAL_YEARS
+    assert count_period_requests(requested_urls) == 2
+    assert all(
+        f"-{year}-FY/" in url for url, year in zip(requested_urls[1:], FISCAL_YEARS[:2])
+    )
+
+
+def test_intrinio_balance_sheet_cache_keys_hide_api_key(requested_urls):
+    extract(limit=2)
+
+    for cache in (intrinio_fundamentals_cache, intrinio_statements_cache):
+        assert cache._entries
+        for key in cache._entries:
+            assert "KEY" not in key
+
+
+def test_intrinio_balance_sheet_empty_fundamentals_not_cached(
+    requested_urls, monkeypatch
+):
+    async def mock_get_data_one(url, **kwargs):
+        requested_urls.append(url)
+        return {"fundamentals": []}
+
+    monkeypatch.setattr(balance_sheet, "get_data_one", mock_get_data_one)
+
+    assert extract(limit=3) == []
+    assert extract(limit=3) == []
+    assert len(requested_urls) == 2
+    assert not intrinio_fundamentals_cache._entries